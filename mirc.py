@@ -16,21 +16,25 @@ from pygments.token import Text, Comment, Operator, Keyword, Name, String, \
 
 __all__ = ['MircLexer']
 
+# Shared 'on <level>:' prefix of every event definition
+ON_PREFIX = r'^on[ \t]+(?:me:)?[^ \t:]+:'
+
 class MircLexer(RegexLexer):
 
 	name = 'mIRC'
 	aliases = ['mirc']
 	filenames = ['*.mrc']
+	flags = re.IGNORECASE | re.MULTILINE
 
 	tokens = {
 		'state-code-content': [
 			(r'\n', Text, '#pop'),
 
-			(r'(?:(\{)(?:([ \t]+)?(\n)))', bygroups(Punctuation, Whitespace, Text), 'state-code-block'),
+			(r'(\{)([ \t]*)(\n)', bygroups(Punctuation, Whitespace, Text), 'state-code-block'),
 			
 			include('standard-code'),
 
-			(r'(?:([ \t]+)(\|)([ \t]+))', bygroups(Whitespace, Punctuation, Whitespace), 'state-code-singleline'),
+			(r'([ \t]+)(\|)([ \t]+)', bygroups(Whitespace, Punctuation, Whitespace), 'state-code-singleline'),
 
 			(r'(\S+)', Name.Function, 'state-function'),
 		],
@@ -50,20 +54,20 @@ class MircLexer(RegexLexer):
 
 			(r'(\S+)', Name.Function, ('#pop', 'state-function')),
 			
-			(r'(?:([ \t]+)(\|)([ \t]+))', bygroups(Whitespace, Punctuation, Whitespace), ('#pop', 'state-code-singleline')),
+			(r'([ \t]+)(\|)([ \t]+)', bygroups(Whitespace, Punctuation, Whitespace), ('#pop', 'state-code-singleline')),
 
 			(r'\n', Text, '#pop'),
 		],
 		'standard-code': [
-			(r'(?:((?:else)?if|while)([ \t]+)(\())', bygroups(Keyword, Whitespace, Keyword), 'state-conditional-outer'),
-			(r'(?:(else)([ \t]+))', bygroups(Keyword, Whitespace)),
+			(words(('elseif', 'if', 'while'), suffix=r'(?=[ \t]+\()'), Keyword, 'state-conditional-outer-entry'),
+			(r'(else)([ \t]+)', bygroups(Keyword, Whitespace)),
 
 			# CHANGES START
-			(r'(?:(alias)([ \t]+)(\S+)([ \t]+))', bygroups(Name.Function, Whitespace, Name.Function, Whitespace), ('#pop', 'state-code-singleline')),
+			(r'(alias)([ \t]+)(\S+)([ \t]+)', bygroups(Name.Function, Whitespace, Name.Function, Whitespace), ('#pop', 'state-code-singleline')),
 			# CHANGES END
 
-			(r'(?:(\{)([ \t]+)?)', bygroups(Punctuation, Whitespace), '#push'),
-			(r'(?:(?<!^)([ \t]+)?(\}))', bygroups(Whitespace, Punctuation), '#pop'),
+			(r'(\{)([ \t]*)', bygroups(Punctuation, Whitespace), '#push'),
+			(r'(?<!^)([ \t]*)(\})', bygroups(Whitespace, Punctuation), '#pop'),
 
 			include('variables'),
 			include('identifiers'),
@@ -77,6 +81,7 @@ class MircLexer(RegexLexer):
 			(r'(?=([ \t]+)\})', Whitespace, '#pop'),
 			(r'$', Text, '#pop'),
 
+			(r'[^$%&\s]+', Text),
 			(r'.', Text),
 		],
 		'whitespace': [
@@ -91,50 +96,58 @@ class MircLexer(RegexLexer):
 			(r'/\*.*', Comment.Multiline, 'state-comments-multiline'),
 		],
 		'state-comments-multiline': [
-			(r'[^*]', Comment.Multiline),
+			(r'[^*]+', Comment.Multiline),
 			(r'\*/\s*', Comment.Multiline, '#pop'),
 			(r'[*]', Comment.Multiline),
 		],
+		'state-conditional-outer-entry': [
+			(r'([ \t]+)(\()', bygroups(Whitespace, Keyword), ('#pop', 'state-conditional-outer')),
+		],
 		'state-conditional-outer': [
 			(r'\(', Punctuation, 'state-conditional-inner'),
-			include('operators'),
-			(r'!(?:(?=[%$&]))', Punctuation),
-			include('identifiers'),
-			include('variables'),
-
-			(r'(?:([ \t]+)(&&|\|\|)([ \t]+))', bygroups(Whitespace, Operator, Whitespace)),
-			(r'(?:(\))([ \t]+))', bygroups(Keyword, Whitespace), '#pop'),
+			include('conditional-common'),
+			(r'(\))([ \t]+)', bygroups(Keyword, Whitespace), '#pop'),
+			(r'[^()$%&!\s]+', String),
 			(r'.', String),
 		],
 		'state-conditional-inner': [
-			include('operators'),
-			(r'!(?:(?=[%$&]))', Punctuation),
-			include('identifiers'),
-			include('variables'),
-			(r'(?:([ \t]+)(&&|\|\|)([ \t]+))', bygroups(Whitespace, Operator, Whitespace)),
+			include('conditional-common'),
 			(r'\)', Punctuation, '#pop'),
 			(r'\(', Punctuation, '#push'),
+			(r'[^()$%&!\s]+', String),
 			(r'.', String),
 		],
+		'conditional-common': [
+			include('operators'),
+			(r'!(?=[%$&])', Punctuation),
+			include('identifiers'),
+			include('variables'),
+			(r'([ \t]+)(&&|\|\|)([ \t]+)', bygroups(Whitespace, Operator, Whitespace)),
+		],
 		'variables': [
-			(r'(?:(?<![^(\s,!])((?:%|&)[^)\s,]+)(?:([ \t]+)(=)([ \t]+)))', bygroups(Name.Variable, Whitespace, Operator, Whitespace), 'state-variable'),
-			(r'(?:(?<![^(\s,!])((?:%|&)[^)\s,]+)(?:([ \t]+)(=))$)', bygroups(Name.Variable, Whitespace, Operator)),
-			(r'(?:(?<![^(\s,!])((?:%|&)[^)\s,]+)(?:([ \t]+)(\[)))', bygroups(Name.Variable, Whitespace, Punctuation), 'state-eval-bracket'),
-			(r'(?:(?<![^(\s,!])((?:%|&)[^)\s,]+))', Name.Variable),
-			(r'(?:([ \t]+)(=)([ \t]+))', bygroups(Whitespace, Operator, Whitespace)),
+			(r'(?<![^(\s,!])[%&][^)\s,]+(?=[ \t]+[=\[])', Name.Variable, 'state-variable-operator'),
+			(r'(?<![^(\s,!])[%&][^)\s,]+', Name.Variable),
+			(r'([ \t]+)(=)([ \t]+)', bygroups(Whitespace, Operator, Whitespace)),
+		],
+		'state-variable-operator': [
+			(r'([ \t]+)(=)([ \t]+)', bygroups(Whitespace, Operator, Whitespace), ('#pop', 'state-variable')),
+			(r'([ \t]+)(=)$', bygroups(Whitespace, Operator), '#pop'),
+			(r'([ \t]+)(\[)', bygroups(Whitespace, Punctuation), ('#pop', 'state-eval-bracket')),
+			default('#pop'),
 		],
 		'menu-variables': [
-			(r'(?:(?<![^(\s.,!])((?:%|&)[^)\s,:]+))', Name.Variable),
+			(r'(?<![^(\s.,!])[%&][^)\s,:]+', Name.Variable),
 		],
 		'state-variable': [
 			(r',', Punctuation, '#pop'),
-			(r'(?:([ \t]+)(\|)([ \t]+))', bygroups(Whitespace, Punctuation, Whitespace), '#pop'),
+			(r'([ \t]+)(\|)([ \t]+)', bygroups(Whitespace, Punctuation, Whitespace), '#pop'),
 			(r'(?=([ \t]+)\})', Whitespace, '#pop'),
 			(r'$', Text, '#pop'),
 
 			include('identifiers'),
 			include('variables'),
 
+			(r'[^,$%&\s]+', Text),
 			(r'.', Text),
 		],
 		'state-eval-bracket': [
@@ -142,23 +155,28 @@ class MircLexer(RegexLexer):
 			include('variables'),
 			(r'\]', Punctuation, '#pop'),
 			(r'\[', Punctuation, '#push'),
+			(r'[^$%&\s\[\]]+', Text),
 			(r'.', Text)
 		],
 		'identifiers': [
-			(r'(?:(?<![^( ,!])(\$iif)(\())', bygroups(Keyword, Keyword), 'state-conditional-iif-outer'),
-			(r'(?:(?<![^( ,!])(\$[^\s(),]+)(\())', bygroups(Name.Function, Name.Function), 'state-identifier-content'),
-			(r'(?:(?<![^( ,!])(\$[^\s(),]+))', Name.Function),
+			(r'(?<![^( ,!])\$iif\(', Keyword, 'state-conditional-iif-outer'),
+			(r'(?<![^( ,!])\$[^\s(),]+', Name.Function, 'state-identifier-open'),
+		],
+		'state-identifier-open': [
+			(r'\(', Name.Function, ('#pop', 'state-identifier-content')),
+			default('#pop'),
 		],
 		'menu-identifiers': [
-			(r'(?:(?<![^( .,!])(\$iif)(\())', bygroups(Keyword, Keyword), 'state-conditional-iif-outer'),
-			(r'(?:(?<![^( .,!])(\$[^\s(),]+)(\())', bygroups(Name.Function, Name.Function), 'state-identifier-content'),
-			(r'(?:(?<![^( .,!])(\$[^\s(),:]+))', Name.Function),
+			(r'(?<![^( .,!])\$iif\(', Keyword, 'state-conditional-iif-outer'),
+			(r'(?<![^( .,!])\$[^\s(),]+\(', Name.Function, 'state-identifier-content'),
+			(r'(?<![^( .,!])\$[^\s(),:]+', Name.Function),
 		],
 		'state-identifier-content': [
 			include('identifiers'),
 			include('variables'),
 			(r',', Punctuation),
 			(r'\)', Name.Function, '#pop'),
+			(r'[^,)$%&\s]+', String),
 			(r'[^,)]', String),
 		],
 		'operators': [
@@ -166,41 +184,26 @@ class MircLexer(RegexLexer):
 				'===', '!==', '!==='), 
 				prefix=r'[ \t]+', suffix=r'[ \t]+'), 
 				Operator),
-			(words(('isin', 'isincs', 'iswm', 'iswmcs'),
-				prefix=r'[ \t]+!?', suffix=r'[ \t]+'),
-				Operator.Word),
-			(words(('isnum', 'isletter', 'isalnum', 'isalpha', 'islower', 'isupper'),
-				prefix=r'[ \t]+!?', suffix=r'[ \t]*?'),
-				Operator.Word),
-			(words(('ison', 'isop', 'ishop', 'isvoice', 'isreg', 'ischan', 'isban', 'isquiet', 
-				'isaop', 'isavoice', 'isignore', 'isprotected', 'isnotify', 'isadmin', 
-				'isowner', 'isquiet', 'isurl', ),
-				prefix=r'[ \t]+!?', suffix=r'[ \t]*?'),
+			(words(('isin', 'isincs', 'iswm', 'iswmcs', 'isnum', 'isletter', 'isalnum',
+				'isalpha', 'islower', 'isupper', 'ison', 'isop', 'ishop', 'isvoice',
+				'isreg', 'ischan', 'isban', 'isquiet', 'isaop', 'isavoice', 'isignore',
+				'isprotected', 'isnotify', 'isadmin', 'isowner', 'isurl'),
+				prefix=r'[ \t]+!?', suffix=r'(?=[ \t)]|$)'),
 				Operator.Word),
 		],
 		'state-conditional-iif-outer': [
-			(r'\(', Punctuation, 'state-conditional-iif-inner'),
-			include('operators'),
-			(r'!(?=[%$&])|,', Punctuation),
-			include('identifiers'),
-			include('variables'),
-
-			(r'(?:([ \t]+)(&&|\|\|)([ \t]+))', bygroups(Whitespace, Operator, Whitespace)),
-			(r'(?:(\))([ \t]+)?)', bygroups(Keyword, Whitespace), '#pop'),
-			(r'.', String),
-		],
-		'state-conditional-iif-inner': [
-			include('operators'),
-			(r'!(?:(?=[%$&]))', Punctuation),
-			include('identifiers'),
-			include('variables'),
-			(r'(?:([ \t]+)(&&|\|\|)([ \t]+))', bygroups(Whitespace, Operator, Whitespace)),
-			(r'\)', Punctuation, '#pop'),
-			(r'\(', Punctuation, '#push'),
+			(r'\(', Punctuation, 'state-conditional-inner'),
+			include('conditional-common'),
+			(r',', Punctuation),
+			(r'(\))([ \t]*)', bygroups(Keyword, Whitespace), '#pop'),
+			(r'[^()$%&!,\s]+', String),
 			(r'.', String),
 		],
 		'state-dialog-content': [
-			(r'(?i)^(?:([ \t]+)(title|icon|size|option|text|edit|button|check|radio|box|scroll|list|combo|icon|link|tab|menu|item)([ \t]+))', bygroups(Whitespace, Name.Other, Whitespace)),
+			(words(('title', 'icon', 'size', 'option', 'text', 'edit', 'button', 'check',
+				'radio', 'box', 'scroll', 'list', 'combo', 'link', 'tab', 'menu', 'item'),
+				prefix=r'^([ \t]+)', suffix=r'([ \t]+)'),
+				bygroups(Whitespace, Name.Other, Whitespace)),
 			include('comments'),
 			include('variables'),
 			include('identifiers'),
@@ -212,10 +215,11 @@ class MircLexer(RegexLexer):
 			(r',', Punctuation),
 			(r'\}', Punctuation, '#pop'),
 			(r'\n', Text),
+			(r'[^;/$%&"\d,}\s]+', Text),
 			(r'.', Text),
 		],
 		'state-menu-block': [
-			(r'^(?:([ ]{2})+(\.*))', bygroups(Whitespace, Punctuation), 'state-menu-singleline-first'),
+			(r'^((?: {2})+)(\.*)', bygroups(Whitespace, Punctuation), 'state-menu-singleline-first'),
 			(r'^\}', Punctuation, '#pop'),
 			(r'\n', Text),
 		],
@@ -224,23 +228,24 @@ class MircLexer(RegexLexer):
 			include('menu-identifiers'),
 			(r':', Punctuation, ('#pop', 'state-menu-code-content')),
 			(r'$', Text, '#pop'),
+			(r'[^$%&:\s]+', String),
 			(r'.', String),
 		],
 		'state-menu-code-content': [
 			(r'\n', Text, '#pop'),
 
-			(r'(?:(\{)(?:([ \t]+)?(\n)))', bygroups(Punctuation, Whitespace, Text), 'state-menu-code-block'),
+			(r'(\{)([ \t]*)(\n)', bygroups(Punctuation, Whitespace, Text), 'state-menu-code-block'),
 			
 			include('standard-code'),
 
-			(r'(?:([ \t]+)(\|)([ \t]+))', bygroups(Whitespace, Punctuation, Whitespace), 'state-code-singleline'),
+			(r'([ \t]+)(\|)([ \t]+)', bygroups(Whitespace, Punctuation, Whitespace), 'state-code-singleline'),
 
 			(r'(\S+)', Name.Function, 'state-function'),
 		],
 		'state-menu-code-block': [
 			(r'^(?![ \t]+\})([ \t]+)', Whitespace, 'state-code-singleline'),
 
-			(r'^(?:([ \t]+)(\}))', bygroups(Whitespace, Punctuation), '#pop'),
+			(r'^([ \t]+)(\})', bygroups(Whitespace, Punctuation), '#pop'),
 			
 			(r'\n', Text),
 		],
@@ -248,31 +253,32 @@ class MircLexer(RegexLexer):
 			# Comments below
 			include('comments'),
 			# Events below
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(agent|appactive|connect(fail)?|disconnect|dns|exit|(un)?load|(midi|mp3|play|song|wave)end|nick|nosound|u?notify|ping|pong|quit|start|usermode|options|resume|song|suspend):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(?:action|notice|(?:client)?text):(?:(%[^:]+)|[^:]+):(?:(%[^:]+)|[^:]+):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(active|input|tabcomp|mscroll):(\*|#[^:]*|\?|=|!|@[^:]*|(%[^:]+)):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):open:(\*|\?|=|!|@[^:]*|(%[^:]+)):[^:]+:)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(?:close|open):(\*|\?|=|!|@[^:]*|(%[^:]+)):)', Name.Builtin, 'state-code-content'),	
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):dialog:[^:]+:(?:init|close|edit|sclick|dclick|menu|scroll|mouse|rclick|drop|\*|(%[^:]+)):(?:(%[^:]+)|[\d\-,\*]+):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):((un)?ban|(de)?help|(de|server)?op|(de)?owner|(de)?voice|invite|join|kick|(server|raw)?mode|part|topic|(de)?admin):(\*|#[^:]*|(%[^:]+)):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(?:chat|ctcpreply|error|file(?:rcvd|sent)|(?:get|send)fail|logon|serv|signal|snotice|sock(?:close|listen|open|read|write)|udp(?:read|write)|vcmd|wallops|download|(?:un)?zip):(?:(%[^:]+)|[^:]+):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):dccserver:(?:chat|send|fserve):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):hotlink:[^:]+:(?:\\*|#[^:]*|\?|=|!|@[^:]*|(%[^:]+)):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(?:key(?:down|up)|char):(?:\\*|@[^:]*|(%[^:]+)):(?:\*|\d+(?:,\d+)*|(%[^:]+)):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):parseline:(?:\\*|in|out|(%[^:]+)):(?:(%[^:]+)|[^:]+):)', Name.Builtin, 'state-code-content'),
-			(r'(?i)^(on(?:[ \t]+)(?:me:)?(?:[^ \t:]+):(?:chat|ctcpreply|error|file(?:rcvd|sent)|(?:get|send)fail|logon|serv|signal|snotice|sock(?:close|listen|open|read|write)|udp(?:read|write)|vcmd|wallops|download|(?:un)?zip):(?:(%[^:]+)|[^:]+):),', bygroups(Name.Builtin, Name.Variable), 'state-code-content'),
+			(ON_PREFIX + r'(?:'
+				r'(?:agent|appactive|connect(?:fail)?|disconnect|dns|exit|(?:un)?load|(?:midi|mp3|play|song|wave)end|nick|nosound|u?notify|ping|pong|quit|start|usermode|options|resume|song|suspend):'
+				r'|(?:action|notice|(?:client)?text):(?:%[^:]+|[^:]+):(?:%[^:]+|[^:]+):'
+				r'|(?:active|input|tabcomp|mscroll):(?:\*|#[^:]*|\?|=|!|@[^:]*|%[^:]+):'
+				r'|open:(?:\*|\?|=|!|@[^:]*|%[^:]+):[^:]+:'
+				r'|(?:close|open):(?:\*|\?|=|!|@[^:]*|%[^:]+):'
+				r'|dialog:[^:]+:(?:init|close|edit|sclick|dclick|menu|scroll|mouse|rclick|drop|\*|%[^:]+):(?:%[^:]+|[\d\-,\*]+):'
+				r'|(?:(?:un)?ban|(?:de)?help|(?:de|server)?op|(?:de)?owner|(?:de)?voice|invite|join|kick|(?:server|raw)?mode|part|topic|(?:de)?admin):(?:\*|#[^:]*|%[^:]+):'
+				r'|(?:chat|ctcpreply|error|file(?:rcvd|sent)|(?:get|send)fail|logon|serv|signal|snotice|sock(?:close|listen|open|read|write)|udp(?:read|write)|vcmd|wallops|download|(?:un)?zip):(?:%[^:]+|[^:]+):'
+				r'|dccserver:(?:chat|send|fserve):'
+				r'|hotlink:[^:]+:(?:\\*|#[^:]*|\?|=|!|@[^:]*|%[^:]+):'
+				r'|(?:key(?:down|up)|char):(?:\\*|@[^:]*|%[^:]+):(?:\*|\d+(?:,\d+)*|%[^:]+):'
+				r'|parseline:(?:\\*|in|out|%[^:]+):(?:%[^:]+|[^:]+):'
+				r')', Name.Builtin, 'state-code-content'),
 			# CTCP below
-			(r'(?i)^(ctcp(?:[ \t]+)(?:[^ \t:]+)+:(?:(%[^:]+)|[^:]+):(?:\*|#.*|\?|(%[^:]+)):)', bygroups(Name.Builtin, Name.Variable, Name.Variable), 'state-code-content'),
+			(r'^(ctcp[ \t]+[^ \t:]+:(?:(%[^:]+)|[^:]+):(?:\*|#.*|\?|(%[^:]+)):)', bygroups(Name.Builtin, Name.Variable, Name.Variable), 'state-code-content'),
 			# RAW below
-			(r'(?i)^(raw(?:[ \t]+)(?:[^ \t:]+):(?:(%[^:]+)|[^:]+):)', Name.Builtin, 'state-code-content'),
+			(r'^raw[ \t]+[^ \t:]+:(?:%[^:]+|[^:]+):', Name.Builtin, 'state-code-content'),
 			# Aliases below
-			(r'(?i)^(?:(alias)([ \t]+)(?:(-l)([ \t]+))?(\S+)([ \t]+))', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Name.Function, Whitespace), 'state-code-content'),
+			(r'^(alias)([ \t]+)(?:(-l)([ \t]+))?(\S+)([ \t]+)', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Name.Function, Whitespace), 'state-code-content'),
 			# Groups below
 			(r'^#(\S+[ \t]+(?:on|off|end))', Name.Label),
 			# DIALOGS below
-			(r'(?i)^(?:(dialog)([ \t]+)(?:(-l)([ \t]+))?(\S+)([ \t]+)(\{))', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Name.Function, Whitespace, Punctuation), 'state-dialog-content'),
+			(r'^(dialog)([ \t]+)(?:(-l)([ \t]+))?(\S+)([ \t]+)(\{)', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Name.Function, Whitespace, Punctuation), 'state-dialog-content'),
 			# MENUS
-			(r'(?i)^(?:(menu)([ \t]+)((?:status|channel|query|nicklist|menubar|(?:channel)?link|@[^ \t,]+|\*)(?:,(?:status|channel|query|nicklist|menubar|(?:channel)?link|@[^\t,]+))*|\*)([ \t]+)(\{))', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Punctuation), 'state-menu-block'),
+			(r'^(menu)([ \t]+)((?:status|channel|query|nicklist|menubar|(?:channel)?link|@[^ \t,]+|\*)(?:,(?:status|channel|query|nicklist|menubar|(?:channel)?link|@[^\t,]+))*|\*)([ \t]+)(\{)', bygroups(Name.Builtin, Whitespace, Generic.Strong, Whitespace, Punctuation), 'state-menu-block'),
 			# Catch all
 			# (r'.', Text),
 		],